@@ -1,6 +1,11 @@
 # -*- encoding: utf-8 -*-
+import functools
 import os
+import re
+import sys
+import time
 import warnings
+import weakref
 from pathlib import PosixPath as Path
 from typing import Iterator
 
@@ -10,6 +15,27 @@ __all__ = ['MountPointInfo', 'getMountPoint', 'getAllMountPoints', 'isAMountPoin
 
 __version__ = '1.1.0'
 
+# /proc/mounts does not update its mtime when the mount table changes, so
+# parsed results are only reused within a short time window.
+_CACHE_TTL = 0.05
+# Each entry holds the read time and the snapshot read from /proc/mounts, keyed by pid.
+_CACHE: dict[int, tuple[float, '_MountInfoSnapshot']] = {}
+
+# The kernel octal-escapes space, tab, newline and backslash in the fields of /proc/mounts,
+# and also ``#`` in the source field; the target field only ever uses the first four.
+_ESCAPED_CHAR_RE = re.compile(rb'\\(040|011|012|134|043)')
+_ESCAPED_CHARS = {b'040': b' ', b'011': b'\t', b'012': b'\n', b'134': b'\\', b'043': b'#'}
+
+# Decoding with these directly is equivalent to os.fsdecode(), without its Python-level overhead.
+_FS_ENCODING = sys.getfilesystemencoding()
+_FS_ERRORS = sys.getfilesystemencodeerrors()
+
+# Parsed mount points keyed by the raw fields of their line, so identical lines share one instance.
+_INTERNED: 'weakref.WeakValueDictionary[tuple[bytes, ...], MountPointInfo]' = weakref.WeakValueDictionary()
+
+# One line of /proc/mounts: source, target, fstype, options, fs_freq and fs_passno.
+_MOUNT_INFO_LINE_RE = re.compile(rb'\n*([^ \n]+) ([^ \n]+) ([^ \n]+) ([^ \n]+) ([0-9]+) ([0-9]+) *(?:\n|\Z)')
+
 
 @attrs.frozen(slots=True, kw_only=True, eq=False, order=False, hash=True)
 class MountPointInfo(os.PathLike[str]):
@@ -21,20 +47,22 @@ class MountPointInfo(os.PathLike[str]):
 
     Attributes:
         source (str): The source of the mount point.
-        target (Path): The target path of the mount point.
+        target (str): The target path of the mount point, exactly as reported by the kernel in ``/proc/mounts``.
+        target_path (Path): Attribute ``target`` as a ``pathlib.PosixPath`` object, created on first access.
         fstype (str): The file system type of the mount point.
         options (tuple[str, ...]): The options associated with the mount point.
         freq (int): The frequency of filesystem checks.
         passno (int): The pass number used by the filesystem checker.
 
     Methods:
-        isAlive(self) -> bool:
+        isAlive(self, *, strict: bool = False) -> bool:
             Returns ``False`` when called if attribute ``target`` is no longer a mount point; otherwise it returns ``True``.
+            If ``strict`` is ``True``, also checks that the mount point still has the same information.
         isStillMounted(self) -> bool:
             Deprecated. Use method ``isAlive()`` instead.
     """
     source: str = attrs.field(validator=attrs.validators.instance_of(str))
-    target: Path = attrs.field(validator=attrs.validators.instance_of(Path))
+    target: str = attrs.field(converter=os.fsdecode, validator=attrs.validators.instance_of(str))
     fstype: str = attrs.field(validator=attrs.validators.instance_of(str))
     options: tuple[str, ...] = attrs.field(
         validator=attrs.validators.deep_iterable(
@@ -45,9 +73,29 @@ class MountPointInfo(os.PathLike[str]):
     freq: int = attrs.field(validator=attrs.validators.instance_of(int))
     passno: int = attrs.field(validator=attrs.validators.instance_of(int))
 
+    @functools.cached_property
+    def target_path(self) -> Path:
+        return Path(self.target)
+
+    @classmethod
+    def _unchecked(
+            cls, source: str, target: str, fstype: str, options: tuple[str, ...], freq: int, passno: int
+    ) -> 'MountPointInfo':
+        # Values parsed from /proc/mounts are trusted, so skip the validators run by __init__().
+        self = object.__new__(cls)
+        object.__setattr__(self, 'source', source)
+        object.__setattr__(self, 'target', target)
+        object.__setattr__(self, 'fstype', fstype)
+        object.__setattr__(self, 'options', options)
+        object.__setattr__(self, 'freq', freq)
+        object.__setattr__(self, 'passno', passno)
+        return self
+
     def __eq(self, other: 'MountPointInfo', /) -> bool:
-        return all(
-            getattr(self, attr) == getattr(other, attr) for attr in attrs.asdict(self)  # type:ignore
+        return self is other or (
+                (self.source, self.target, self.fstype, self.options, self.freq, self.passno)
+                ==
+                (other.source, other.target, other.fstype, other.options, other.freq, other.passno)
         )
 
     def __eq__(self, other: 'MountPointInfo', /) -> bool:
@@ -58,7 +106,7 @@ class MountPointInfo(os.PathLike[str]):
     def __lt__(self, other: 'MountPointInfo', /) -> bool:
         if type(other) is not type(self):
             return NotImplemented
-        return self.target < other.target
+        return self.target_path < other.target_path
 
     def __le__(self, other: 'MountPointInfo', /) -> bool:
         return NotImplemented
@@ -66,13 +114,13 @@ class MountPointInfo(os.PathLike[str]):
     def __gt__(self, other: 'MountPointInfo', /) -> bool:
         if type(other) is not type(self):
             return NotImplemented
-        return self.target > other.target
+        return self.target_path > other.target_path
 
     def __ge__(self, other: 'MountPointInfo', /) -> bool:
         return NotImplemented
 
     def __fspath__(self) -> str:
-        return os.fspath(self.target)
+        return self.target
 
     def isStillMounted(self) -> bool:
         """
@@ -86,13 +134,23 @@ class MountPointInfo(os.PathLike[str]):
         )
         return self.isAlive()
 
-    def isAlive(self) -> bool:
+    def isAlive(self, *, strict: bool = False) -> bool:
         """
         Returns ``False`` when called if attribute ``target`` is no longer a mount point; otherwise it returns ``True``.
+
+        By default, only ``os.path.ismount()`` is used to check, which cannot detect the mount point
+        being replaced by another mount or remounted in place with changed options.
+
+        Parameters:
+            strict (bool): If ``True``, also re-read ``/proc/mounts``, bypassing any cached results, and return ``True``
+                only if the mount point on ``target`` still has the same information as this instance.
         """
+        if not strict:
+            return os.path.ismount(self.target)
+
         if os.path.ismount(self.target):
             try:
-                if mnt := getMountPoint(self.target):
+                if mnt := _findMountPointUncached(self.target):
                     return self.__eq(mnt)
             except ValueError:
                 pass
@@ -100,82 +158,200 @@ class MountPointInfo(os.PathLike[str]):
         return False
 
 
-def _mountsFileLineToMountPointInfo(line: str) -> MountPointInfo:
-    line_parts = [s.replace('\\040', ' ').replace('\\012', '\n') for s in line.strip(' \n').split(' ')]
-    if len(line_parts) != 6:
+@attrs.define(slots=True)
+class _MountInfoSnapshot:
+    raw: bytes
+    # Filled in by the first full parse of ``raw``.
+    mount_point_infos: list[MountPointInfo] | None = None
+    # The first mount point for each target; also memoizes lookups made before a full parse, including misses.
+    mount_point_infos_by_target: dict[str, MountPointInfo | None] = attrs.Factory(dict)
+
+
+def _unescapeMountInfoField(field: bytes) -> bytes:
+    if b'\\' not in field:
+        return field
+    return _ESCAPED_CHAR_RE.sub(lambda m: _ESCAPED_CHARS[m[1]], field)
+
+
+def _matchToMountPointInfo(match: re.Match[bytes]) -> MountPointInfo:
+    raw_fields = match.groups()
+    if (mount_point_info := _INTERNED.get(raw_fields)) is not None:
+        return mount_point_info
+    raw_source, raw_target, raw_fstype, raw_options, raw_freq, raw_passno = raw_fields
+
+    source = _unescapeMountInfoField(raw_source).decode(_FS_ENCODING, _FS_ERRORS)
+    fstype = _unescapeMountInfoField(raw_fstype).decode(_FS_ENCODING, _FS_ERRORS)
+    options = tuple(_unescapeMountInfoField(raw_options).decode(_FS_ENCODING, _FS_ERRORS).split(','))
+    # The kernel almost always emits b'0' for both numeric fields.
+    freq = 0 if raw_freq == b'0' else int(raw_freq)
+    passno = 0 if raw_passno == b'0' else int(raw_passno)
+
+    target = _unescapeMountInfoField(raw_target).decode(_FS_ENCODING, _FS_ERRORS)
+
+    return _INTERNED.setdefault(raw_fields, MountPointInfo._unchecked(source, target, fstype, options, freq, passno))
+
+
+def _mountsFileLineToMountPointInfo(line: bytes) -> MountPointInfo:
+    if (match := _MOUNT_INFO_LINE_RE.fullmatch(line)) is None:
         raise ValueError(f'Not a valid line of mount info: {line!r}')
+    return _matchToMountPointInfo(match)
 
-    source = line_parts[0]
-    raw_target = line_parts[1]
-    fstype = line_parts[2]
-    options = tuple(line_parts[3].split(','))
-    raw_freq = line_parts[4]
-    if not raw_freq.isdigit():
-        raise ValueError(f'Invalid value of fs_freq: {raw_freq!r}')
-    freq = int(raw_freq)
-    raw_passno = line_parts[5]
-    if not raw_passno.isdigit():
-        raise ValueError(f'Invalid value of fs_passno: {raw_passno!r}')
-    passno = int(raw_passno)
 
-    target = Path(str(bytes(raw_target, encoding='raw_unicode_escape'), encoding='unicode_escape')).resolve()
+def _readMountInfoFile() -> bytes:
+    # Opened for every read, so the result always reflects the current mount namespace and root.
+    fd = os.open('/proc/mounts', os.O_RDONLY | os.O_CLOEXEC)
+    try:
+        # Read in large chunks until EOF; procfs may return short reads.
+        chunks = []
+        while chunk := os.read(fd, 65536):
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
 
-    return MountPointInfo(source=source, target=target, fstype=fstype, options=options, freq=freq, passno=passno)
+    return b''.join(chunks)
 
 
-def _iteratedParseMountInfoFile() -> Iterator[MountPointInfo]:
-    mount_info_file = Path('/proc/mounts')
+def _escapeMountInfoField(field: bytes) -> bytes:
+    # The inverse of the octal escaping applied by the kernel to /proc/mounts.
+    return field.replace(b'\\', b'\\134').replace(b' ', b'\\040').replace(b'\t', b'\\011').replace(b'\n', b'\\012')
 
-    with open(mount_info_file, mode='r', newline='') as f:
-        mount_info_text = f.read()
 
-    for line in mount_info_text.split('\n'):
-        if line:
-            mount_point_info = _mountsFileLineToMountPointInfo(line)
-            yield mount_point_info
+def _findRawMountLineForTarget(mount_info: bytes, encoded_target: bytes) -> bytes | None:
+    needle = b' ' + encoded_target + b' '
+    pos = mount_info.find(needle)
+    while pos != -1:
+        line_start = mount_info.rfind(b'\n', 0, pos) + 1
+        # The target is the second field: no other space may precede it on its line.
+        if mount_info.find(b' ', line_start, pos) == -1:
+            line_end = mount_info.find(b'\n', pos)
+            return mount_info[line_start:] if line_end == -1 else mount_info[line_start:line_end]
+        pos = mount_info.find(needle, pos + 1)
+
+    return None
+
+
+def _invalidateCache() -> None:
+    _CACHE.clear()
+
+
+def _getMountInfoSnapshot() -> _MountInfoSnapshot:
+    pid = os.getpid()
+    now = time.monotonic()
+    if (cached := _CACHE.get(pid)) and now - cached[0] < _CACHE_TTL:
+        return cached[1]
+
+    snapshot = _MountInfoSnapshot(_readMountInfoFile())
+    _CACHE.clear()
+    _CACHE[pid] = now, snapshot
+    return snapshot
+
+
+def _iteratedParseMountInfoFile() -> Iterator[MountPointInfo]:
+    snapshot = _getMountInfoSnapshot()
+    if snapshot.mount_point_infos is not None:
+        yield from snapshot.mount_point_infos
+        return
+
+    mount_info = snapshot.raw
+    mount_point_infos = []
+    # Bound to locals to avoid repeated attribute and global lookups per line.
+    match_line = _MOUNT_INFO_LINE_RE.match
+    append = mount_point_infos.append
+    pos = 0
+    end = len(mount_info.rstrip(b'\n'))
+    while pos < end:
+        if (match := match_line(mount_info, pos)) is None:
+            _invalidateCache()
+            line = mount_info[pos:].lstrip(b'\n').split(b'\n', 1)[0]
+            raise ValueError(f'Not a valid line of mount info: {line!r}')
+        append(_matchToMountPointInfo(match))
+        pos = match.end()
+
+    for mount_point_info in mount_point_infos:
+        snapshot.mount_point_infos_by_target.setdefault(mount_point_info.target, mount_point_info)
+    snapshot.mount_point_infos = mount_point_infos
+    yield from mount_point_infos
 
 
 def getMountPoint(target: str | bytes | os.PathLike) -> MountPointInfo | None:
     """
     Get the ``MountPointInfo`` object corresponding to the given target path.
 
+    The result may come from a read of ``/proc/mounts`` up to 50 milliseconds old,
+    so a mount change made just before the call may not be reflected yet.
+
     Parameters:
         target (str | bytes | os.PathLike): The target path for which to retrieve the ``MountPointInfo`` object.
 
     Returns:
         MountPointInfo | None: The ``MountPointInfo`` object corresponding to the target path, or ``None`` if not found.
     """
-    target_path = Path(os.fsdecode(target)).resolve()
+    target_path = os.path.realpath(os.fsdecode(target))
 
-    for mount_point_info in _iteratedParseMountInfoFile():
-        if mount_point_info.target != target_path:
-            continue
+    snapshot = _getMountInfoSnapshot()
+    mount_point_infos_by_target = snapshot.mount_point_infos_by_target
+    if target_path in mount_point_infos_by_target:
+        return mount_point_infos_by_target[target_path]
+    if snapshot.mount_point_infos is not None:
+        return None
 
-        return mount_point_info
+    try:
+        mount_point_info = _findMountPointInMountInfo(snapshot.raw, target_path)
+    except ValueError:
+        _invalidateCache()
+        raise
+    mount_point_infos_by_target[target_path] = mount_point_info
+    return mount_point_info
+
+
+def _findMountPointInMountInfo(mount_info: bytes, target: str) -> MountPointInfo | None:
+    # Only the matching line is parsed; the others are compared as raw bytes.
+    line = _findRawMountLineForTarget(mount_info, _escapeMountInfoField(os.fsencode(target)))
+    if line is not None:
+        return _mountsFileLineToMountPointInfo(line)
+    return None
+
+
+def _findMountPointUncached(target: str) -> MountPointInfo | None:
+    return _findMountPointInMountInfo(_readMountInfoFile(), target)
 
 
 def getAllMountPoints() -> list[MountPointInfo]:
     """
     Return a list of all current mount points on the system.
 
+    The result may come from a read of ``/proc/mounts`` up to 50 milliseconds old,
+    so a mount change made just before the call may not be reflected yet.
+
     Returns:
         list[MountPointInfo]: A list of ``MountPointInfo`` objects representing information about each mounted mount point.
     """
     return list(_iteratedParseMountInfoFile())
 
 
-def isAMountPoint(target: str | bytes | os.PathLike | MountPointInfo) -> bool:
+def isAMountPoint(target: str | bytes | os.PathLike | MountPointInfo, *, strict: bool = False) -> bool:
     """
     Check if the given ``target`` is a mount point or not.
 
+    By default, only ``os.path.ismount()`` is used to check, and ``/proc/mounts`` is not read.
+
     Parameters:
         target (str | bytes | os.PathLike | MountPointInfo): The target to check if it is a mount point or not.
+        strict (bool): If ``True``, ``target`` must also be listed in ``/proc/mounts``, which is re-read bypassing any cached results;
+            if ``target`` is a ``MountPointInfo``, it is passed to ``MountPointInfo.isAlive()``.
 
     Returns:
         bool: ``True`` if the ``target`` is a mount point and still mounted, ``False`` otherwise.
     """
     if isinstance(target, MountPointInfo):
-        return target.isAlive()
-    if mnt := getMountPoint(target):
-        return mnt.isAlive()
-    return False
+        return target.isAlive(strict=strict)
+    if strict:
+        if mnt := _findMountPointUncached(os.path.realpath(os.fsdecode(target))):
+            return os.path.ismount(mnt.target)
+        return False
+
+    target_path = os.fsdecode(target)
+    if os.path.ismount(target_path):
+        return True
+    # os.path.ismount() does not follow a symlink, while getMountPoint() resolves it.
+    return os.path.islink(target_path) and os.path.ismount(os.path.realpath(target_path))
@@ -0,0 +1,270 @@
+# -*- encoding: utf-8 -*-
+import os
+
+import pytest
+
+import mntfinder
+
+MOUNT_INFO = (
+    b'proc /proc proc rw,nosuid,nodev,noexec,relatime 0 0\n'
+    b'my\\040src /nonexistent/a\\040b\\134c fuse.x rw,user_id=1000 0 0\n'
+    b'first /nonexistent/dup tmpfs rw 0 0\n'
+    b'second /nonexistent/dup tmpfs ro 1 2\n'
+    b'/dev/sda1 /nonexistent/tab\\011nl\\012 ext4 rw,relatime 0 0\n'
+)
+
+
+@pytest.fixture(autouse=True)
+def _clearCache():
+    mntfinder._invalidateCache()
+    yield
+    mntfinder._invalidateCache()
+
+
+class FakeMountInfoFile:
+    def __init__(self, data: bytes) -> None:
+        self.data = data
+        self.reads = 0
+
+    def __call__(self, data: bytes) -> None:
+        self.data = data
+        mntfinder._invalidateCache()
+
+    def read(self) -> bytes:
+        self.reads += 1
+        return self.data
+
+
+@pytest.fixture
+def mountInfo(monkeypatch):
+    fake = FakeMountInfoFile(MOUNT_INFO)
+    monkeypatch.setattr(mntfinder, '_readMountInfoFile', fake.read)
+    return fake
+
+
+def isFullyParsed() -> bool:
+    return any(snapshot.mount_point_infos is not None for _, snapshot in mntfinder._CACHE.values())
+
+
+def test_parseAllFields(mountInfo):
+    mnts = mntfinder.getAllMountPoints()
+
+    assert [m.target for m in mnts] == [
+        '/proc', '/nonexistent/a b\\c', '/nonexistent/dup', '/nonexistent/dup', '/nonexistent/tab\tnl\n'
+    ]
+    assert mnts[0].source == 'proc'
+    assert mnts[0].fstype == 'proc'
+    assert mnts[0].options == ('rw', 'nosuid', 'nodev', 'noexec', 'relatime')
+    assert (mnts[3].freq, mnts[3].passno) == (1, 2)
+
+
+def test_unescapeSourceAndTarget(mountInfo):
+    mnt = mntfinder.getAllMountPoints()[1]
+
+    assert mnt.source == 'my src'
+    assert mnt.target == '/nonexistent/a b\\c'
+    assert str(mnt.target_path) == '/nonexistent/a b\\c'
+
+
+def test_unescapeHashInSource(mountInfo):
+    mountInfo(b's\\043rc /nonexistent/c\\040d tmpfs rw 0 0\n')
+
+    mnt = mntfinder.getMountPoint('/nonexistent/c d')
+
+    assert mnt.source == 's#rc'
+
+
+@pytest.mark.parametrize('warm', [False, True])
+def test_getMountPointFirstDuplicateWins(mountInfo, warm):
+    if warm:
+        mntfinder.getAllMountPoints()
+
+    mnt = mntfinder.getMountPoint('/nonexistent/dup')
+
+    assert mnt is not None
+    assert mnt.source == 'first'
+
+
+@pytest.mark.parametrize('target', [
+    '/proc', '/nonexistent/a b\\c', b'/nonexistent/a b\\c', '/nonexistent/dup', '/nonexistent/tab\tnl\n',
+    '/nonexistent/missing', '/nonexistent/a',
+])
+def test_getMountPointSameWithAndWithoutCache(mountInfo, target):
+    cold = mntfinder.getMountPoint(target)
+    assert not isFullyParsed()
+
+    mntfinder.getAllMountPoints()
+    assert isFullyParsed()
+    warm = mntfinder.getMountPoint(target)
+
+    assert cold is warm
+    if cold is not None:
+        assert cold.target == os.fsdecode(target)
+
+
+@pytest.mark.parametrize('line', [
+    b'too few fields 0',
+    b'a /b c d x 0',
+    b'a /b c d 0 0 extra',
+])
+def test_malformedLineRaises(mountInfo, line):
+    mountInfo(MOUNT_INFO + line + b'\n')
+
+    with pytest.raises(ValueError, match='Not a valid line of mount info'):
+        mntfinder.getAllMountPoints()
+    assert not mntfinder._CACHE
+
+
+def test_malformedMatchingLineRaisesInGetMountPoint(mountInfo):
+    mountInfo(b'a /nonexistent/bad c d x 0\n')
+
+    with pytest.raises(ValueError):
+        mntfinder.getMountPoint('/nonexistent/bad')
+    assert not mntfinder._CACHE
+
+
+def test_blankLinesAndMissingTrailingNewline(mountInfo):
+    mountInfo(b'\n\nproc /proc proc rw 0 0\n\n\nsysfs /sys sysfs rw 0 0')
+
+    assert [m.target for m in mntfinder.getAllMountPoints()] == ['/proc', '/sys']
+    mntfinder._invalidateCache()
+    assert mntfinder.getMountPoint('/sys').source == 'sysfs'
+
+
+def test_emptyMountInfo(mountInfo):
+    mountInfo(b'')
+
+    assert mntfinder.getAllMountPoints() == []
+    assert mntfinder.getMountPoint('/proc') is None
+
+
+def test_identicalLinesAreInterned(mountInfo):
+    first = mntfinder.getAllMountPoints()
+    mntfinder._invalidateCache()
+    second = mntfinder.getAllMountPoints()
+
+    assert all(a is b for a, b in zip(first, second))
+
+
+def test_uncheckedAndValidatedInstancesAgree(mountInfo):
+    parsed = mntfinder.getAllMountPoints()[0]
+    built = mntfinder.MountPointInfo(
+        source=parsed.source, target=parsed.target_path, fstype=parsed.fstype,
+        options=parsed.options, freq=parsed.freq, passno=parsed.passno,
+    )
+
+    assert hash(built) == hash(parsed)
+    assert built.target == parsed.target
+
+
+def test_repeatedGetMountPointReadsOnce(mountInfo):
+    for _ in range(100):
+        assert mntfinder.getMountPoint('/proc').source == 'proc'
+        assert mntfinder.getMountPoint('/nonexistent/missing') is None
+
+    assert mountInfo.reads == 1
+
+
+def test_getAllMountPointsReusesSnapshotOfGetMountPoint(mountInfo):
+    mntfinder.getMountPoint('/proc')
+    mntfinder.getAllMountPoints()
+    mntfinder.getMountPoint('/nonexistent/dup')
+
+    assert mountInfo.reads == 1
+
+
+def test_expiredCacheIsReread(mountInfo, monkeypatch):
+    mntfinder.getMountPoint('/proc')
+    monkeypatch.setattr(mntfinder, '_CACHE_TTL', 0)
+    mntfinder.getMountPoint('/proc')
+
+    assert mountInfo.reads == 2
+
+
+def test_repeatedGetMountPointIsServedFromIndex(mountInfo, monkeypatch):
+    searches = []
+    findRawMountLineForTarget = mntfinder._findRawMountLineForTarget
+
+    def countingFind(mount_info: bytes, encoded_target: bytes) -> bytes | None:
+        searches.append(encoded_target)
+        return findRawMountLineForTarget(mount_info, encoded_target)
+
+    monkeypatch.setattr(mntfinder, '_findRawMountLineForTarget', countingFind)
+    for _ in range(10):
+        assert mntfinder.getMountPoint('/proc').source == 'proc'
+        assert mntfinder.getMountPoint('/nonexistent/missing') is None
+
+    assert len(searches) == 2
+
+
+@pytest.fixture
+def freshCache(monkeypatch):
+    monkeypatch.setattr(mntfinder, '_CACHE_TTL', 3600)
+
+
+def fakeIsMount(monkeypatch, *mounted: str) -> None:
+    monkeypatch.setattr(os.path, 'ismount', lambda path: os.fspath(path) in mounted)
+
+
+def test_isAliveDefaultOnlyChecksIsMount(mountInfo, monkeypatch):
+    mnt = mntfinder.getMountPoint('/proc')
+    mountInfo(b'')
+    reads = mountInfo.reads
+
+    fakeIsMount(monkeypatch, '/proc')
+    assert mnt.isAlive()
+    fakeIsMount(monkeypatch)
+    assert not mnt.isAlive()
+    assert mountInfo.reads == reads
+
+
+def test_isAliveStrictRereadsAndDetectsChangedOptions(mountInfo, monkeypatch, freshCache):
+    fakeIsMount(monkeypatch, '/proc')
+    mnt = mntfinder.getMountPoint('/proc')
+    assert mnt.isAlive(strict=True)
+
+    # Remounted read-only; the cached snapshot is still fresh and unchanged.
+    mountInfo.data = MOUNT_INFO.replace(b'proc rw,', b'proc ro,')
+    reads = mountInfo.reads
+    assert mntfinder.getMountPoint('/proc') is mnt
+    assert mnt.isAlive()
+    assert not mnt.isAlive(strict=True)
+    assert mountInfo.reads == reads + 1
+
+    fakeIsMount(monkeypatch)
+    mountInfo.data = MOUNT_INFO
+    assert not mnt.isAlive(strict=True)
+
+
+def test_isAMountPointListedButNotMounted(mountInfo, monkeypatch):
+    fakeIsMount(monkeypatch)
+
+    assert not mntfinder.isAMountPoint('/proc')
+    assert not mntfinder.isAMountPoint('/proc', strict=True)
+
+
+def test_isAMountPointFollowsSymlink(mountInfo, monkeypatch, tmp_path):
+    real = tmp_path / 'real'
+    real.mkdir()
+    real = os.path.realpath(real)
+    link = tmp_path / 'link'
+    link.symlink_to(real)
+    mountInfo(b'tmpfs ' + mntfinder._escapeMountInfoField(os.fsencode(real)) + b' tmpfs rw 0 0\n')
+    fakeIsMount(monkeypatch, real)
+
+    assert mntfinder.isAMountPoint(link)
+    assert mntfinder.isAMountPoint(link, strict=True)
+    assert not mntfinder.isAMountPoint(tmp_path)
+
+
+def test_isAMountPointStrictIgnoresStaleCache(mountInfo, monkeypatch, freshCache):
+    fakeIsMount(monkeypatch, '/proc', '/nonexistent/new')
+    mntfinder.getAllMountPoints()
+
+    # /proc was unmounted and /nonexistent/new mounted after the cache was filled.
+    mountInfo.data = b'new /nonexistent/new tmpfs rw 0 0\n'
+    assert mntfinder.getMountPoint('/proc') is not None
+    assert mntfinder.getMountPoint('/nonexistent/new') is None
+
+    assert not mntfinder.isAMountPoint('/proc', strict=True)
+    assert mntfinder.isAMountPoint('/nonexistent/new', strict=True)